@@ -7,12 +7,42 @@ from flask import Flask, jsonify, request, make_response
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
 import os
+import queue
 import sys
 
 # Load environment variables early
 load_dotenv()
 
+
+# ----------------------------
+# Logging (non-blocking)
+# ----------------------------
+def configure_logging() -> None:
+    """
+    Send log records through a queue; a listener thread does the actual
+    stdout I/O so request and scheduler threads never block on it.
+    """
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), None)
+    # An unknown LOG_LEVEL must not stop the app from starting
+    root.setLevel(level if isinstance(level, int) else logging.INFO)
+
+    listener.start()
+    atexit.register(listener.stop)
+
+
+configure_logging()
+
 # ----------------------------
 # Create app (initial config)
 # ----------------------------
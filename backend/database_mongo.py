@@ -98,6 +98,12 @@ def create_indexes():
         except Exception:
             pass
 
+        # Reminder scans: range on deadline, then filter out completed tasks
+        try:
+            mongo.db.tasks.create_index([("deadline", 1), ("status", 1)])
+        except Exception:
+            pass
+
         # Optional: text index for search (used by title/description filters)
         try:
             mongo.db.tasks.create_index([("title", "text"), ("description", "text")])
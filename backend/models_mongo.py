@@ -105,6 +105,15 @@ class User:
         data = MongoDBManager.find_document("users", _id_query(uid))
         return User(**data) if data else None
 
+    @staticmethod
+    def find_by_ids(uids):
+        """Fetch many users in one query. Returns {user.id: User}."""
+        ids = list({int(u) for u in uids if u is not None})
+        if not ids:
+            return {}
+        data = MongoDBManager.find_documents("users", {"id": {"$in": ids}})
+        return {u.id: u for u in (User(**doc) for doc in data)}
+
 # =====================================================
 # TASK MODEL
 # =====================================================
@@ -186,6 +195,17 @@ class Task:
         data = MongoDBManager.find_documents("tasks", {}, sort_criteria)
         return [Task(**doc) for doc in data]
 
+    @staticmethod
+    def due_between_query(start, end):
+        """Open tasks whose deadline falls in (start, end] — served by the deadline/status index."""
+        return {"deadline": {"$gt": start, "$lte": end}, "status": {"$ne": "completed"}}
+
+    @staticmethod
+    def find_due_between(start, end):
+        """Nearest deadline first; the (deadline, status) index yields this order without a sort stage."""
+        data = MongoDBManager.find_documents("tasks", Task.due_between_query(start, end), [("deadline", 1)])
+        return [Task(**doc) for doc in data]
+
     @staticmethod
     def find_by_user_id(uid, filters=None):
         q = {"user_id": int(uid)}
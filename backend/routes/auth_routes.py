@@ -167,6 +167,7 @@ Fully supports MongoDB User model methods.
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from datetime import timedelta
+from functools import lru_cache
 import re
 import traceback
 
@@ -178,12 +179,13 @@ auth_bp = Blueprint('auth', __name__)
 # ----------------- Validators -----------------
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 PHONE_RE = re.compile(r"^\+\d{10,15}$")
+NON_DIGIT_RE = re.compile(r"\D+")
 
 
+@lru_cache(maxsize=4096)
 def normalize_whatsapp_number(number: str) -> str:
     """Normalize number => +<digits> format"""
-    number = (number or "").strip().replace(" ", "").replace("-", "")
-    digits = "".join(ch for ch in number if ch.isdigit())
+    digits = NON_DIGIT_RE.sub("", number or "")
     return f"+{digits}" if digits else ""
 
 
@@ -14,7 +14,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from dateutil import parser as date_parser
-from .translation_service import translation_service
+from .translation_service import get_translation_service, normalize_text
 
 
 # -----------------------------
@@ -227,6 +227,7 @@ class AIService:
           - priority, category, subtasks (list),
           - ai_generated, detected_language
         """
+        translation_service = get_translation_service()
         translation = translation_service.translate_to_english(user_input or "")
         original_text = translation.get("original_text") or user_input or ""
         english_text = translation.get("translated_text") or original_text
@@ -234,7 +235,7 @@ class AIService:
 
         multilingual_defaults = {}
         try:
-            multilingual_defaults = translation_service.extract_multilingual_features(original_text, src_lang)
+            multilingual_defaults = translation_service.extract_multilingual_features(normalize_text(original_text), src_lang)
         except Exception:
             multilingual_defaults = {}
 
@@ -421,7 +422,7 @@ class AIService:
         """
         try:
             # Ensure we have an english title to work with
-            trans = translation_service.translate_to_english(title or "")
+            trans = get_translation_service().translate_to_english(title or "")
             eng_title = (trans.get("translated_text") or title or "").strip()
 
             # Quick rule-based fallbacks (very fast and reliable)
@@ -5,12 +5,16 @@ Enhanced reliability, duplicate-job protection, and stronger datetime handling
 
 import os
 import atexit
+import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Union
 
+from apscheduler.events import EVENT_JOB_ADDED, EVENT_JOB_REMOVED
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.mongodb import MongoDBJobStore
 from flask_mail import Mail, Message
 from flask import current_app
 
@@ -24,18 +28,35 @@ try:
 except Exception:
     WhatsAppService = None
 
+logger = logging.getLogger(__name__)
+
 mail = Mail()
 _scheduler: Optional[BackgroundScheduler] = None
-
-
-# ---------- Util: Logger ----------
-def _log(message: str, level: str = "info"):
-    app = current_app if current_app else None
-    if app and hasattr(app, "logger"):
-        log_fn = getattr(app.logger, level, app.logger.info)
-        log_fn(message)
-    else:
-        print(message)
+_jobstore = None  # the scheduler's "default" store, for batched lookups
+
+# Kept current by a scheduler listener so status checks never walk the job store
+_job_count = 0
+_job_count_lock = threading.Lock()
+
+
+# ---------- Job Store ----------
+def _make_jobstore(app):
+    """
+    Persist reminder jobs in MongoDB so they survive restarts and are only
+    loaded when due. Falls back to an in-memory store if Mongo is unavailable
+    or APSCHEDULER_JOBSTORE=memory.
+    """
+    if app.config.get("APSCHEDULER_JOBSTORE", os.getenv("APSCHEDULER_JOBSTORE", "mongodb")) == "memory":
+        return MemoryJobStore()
+    try:
+        from database_mongo import get_mongo
+        mongo = get_mongo()
+        if mongo is None:
+            raise RuntimeError("MongoDB not initialized")
+        return MongoDBJobStore(database=mongo.db.name, collection="scheduler_jobs", client=mongo.cx)
+    except Exception as e:
+        logger.warning("[Scheduler] Persistent job store unavailable, using memory: %s", e)
+        return MemoryJobStore()
 
 
 # ---------- Date Parsing ----------
@@ -44,13 +65,20 @@ def _parse_deadline(value) -> Optional[datetime]:
         return None
     if isinstance(value, datetime):
         return value.replace(tzinfo=None)
+    s = str(value)
     try:
-        dt = date_parser.parse(str(value)) if date_parser else datetime.fromisoformat(str(value))
-        if dt.tzinfo:
-            dt = dt.astimezone(tz=None).replace(tzinfo=None)
-        return dt
-    except Exception:
-        return None
+        # Deadlines are almost always ISO-8601 (to_dict / frontend); the C parser is much faster
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        if not date_parser:
+            return None
+        try:
+            dt = date_parser.parse(s)
+        except Exception:
+            return None
+    if dt.tzinfo:
+        dt = dt.astimezone(tz=None).replace(tzinfo=None)
+    return dt
 
 
 def _format_dt(dt: Optional[datetime]) -> str:
@@ -76,20 +104,20 @@ def _send_email(to: str, subject: str, body: str):
                           body=body)
             if not suppress:
                 mail.send(msg)
-            _log(f"[ReminderEmail] {'(suppressed) ' if suppress else ''}Sent to {to}")
+            logger.info("[ReminderEmail] %sSent to %s", "(suppressed) " if suppress else "", to)
         except Exception as e:
-            _log(f"[ReminderEmail] Failed: {e}", "error")
+            logger.error("[ReminderEmail] Failed: %s", e)
 
 
 def _send_whatsapp(to: Optional[str], text: str):
     if not to or not WhatsAppService:
-        _log("[ReminderWhatsApp] Skipped — no valid number or service missing", "warning")
+        logger.warning("[ReminderWhatsApp] Skipped - no valid number or service missing")
         return
     try:
         sid = WhatsAppService().send_message(to, text)
-        _log(f"[ReminderWhatsApp] Sent SID={sid} → {to}")
+        logger.info("[ReminderWhatsApp] Sent SID=%s to %s", sid, to)
     except Exception as e:
-        _log(f"[ReminderWhatsApp] Error: {e}", "error")
+        logger.error("[ReminderWhatsApp] Error: %s", e)
 
 
 # ---------- Scheduled Job ----------
@@ -102,19 +130,19 @@ def _reminder_job(user_email, user_whatsapp, title, deadline_str):
 
 
 # ---------- Scheduler Manager ----------
-def _schedule_common(task_id, title, deadline_val, user_email, user_whatsapp):
+def _schedule_common(task_id, title, deadline_val, user_email, user_whatsapp, now=None):
     if not task_id:
-        _log("[Scheduler] Missing task_id; cannot schedule", "warning")
+        logger.warning("[Scheduler] Missing task_id; cannot schedule")
         return
 
     dt = _parse_deadline(deadline_val)
     if not dt:
-        _log(f"[Scheduler] Invalid deadline for task {task_id} — skipping", "warning")
+        logger.warning("[Scheduler] Invalid deadline for task %s - skipping", task_id)
         return
 
     reminder_time = dt - timedelta(minutes=30)
-    if reminder_time <= datetime.now():
-        _log(f"[Scheduler] Reminder already passed for task {task_id} — skipping", "warning")
+    if reminder_time <= (now or datetime.now()):
+        logger.warning("[Scheduler] Reminder already passed for task %s - skipping", task_id)
         return
 
     job_id = _job_id(task_id)
@@ -132,9 +160,12 @@ def _schedule_common(task_id, title, deadline_val, user_email, user_whatsapp):
         args=[user_email, user_whatsapp, title, _format_dt(dt)],
         id=job_id,
         replace_existing=True,
+        # A reminder is one message: never run it twice at once. Missed runs
+        # follow the scheduler's job_defaults (coalesced, 10 minute grace).
+        max_instances=1,
     )
 
-    _log(f"[Scheduler] Reminder set for task {task_id} at {reminder_time} (job={job_id})")
+    logger.info("[Scheduler] Reminder set for task %s at %s (job=%s)", task_id, reminder_time, job_id)
 
 
 def schedule_task_reminder(app, task_dict: dict):
@@ -148,7 +179,8 @@ def schedule_task_reminder(app, task_dict: dict):
         )
 
 
-def schedule_task_reminder_from_model(app, task_obj, user_obj):
+def schedule_task_reminder_from_model(app, task_obj, user_obj, now=None):
+    """`now` lets a scan pass one timestamp for every task it schedules."""
     with app.app_context():
         _schedule_common(
             task_id=getattr(task_obj, "id"),
@@ -156,6 +188,7 @@ def schedule_task_reminder_from_model(app, task_obj, user_obj):
             deadline_val=getattr(task_obj, "deadline"),
             user_email=getattr(user_obj, "email"),
             user_whatsapp=getattr(user_obj, "whatsapp_number"),
+            now=now,
         )
 
 
@@ -164,29 +197,68 @@ def remove_task_reminder(task_id):
         return
     try:
         _scheduler.remove_job(_job_id(task_id))
-        _log(f"[Scheduler] Removed job for task {task_id}")
+        logger.info("[Scheduler] Removed job for task %s", task_id)
     except Exception:
         pass
 
 
+def get_scheduler() -> Optional[BackgroundScheduler]:
+    """The app-wide scheduler (None until start_scheduler(app) has run)."""
+    return _scheduler
+
+
+def _track_job_count(event):
+    global _job_count
+    with _job_count_lock:
+        _job_count += 1 if event.code == EVENT_JOB_ADDED else -1
+
+
+def get_job_count() -> int:
+    """Number of scheduled reminder jobs, without querying the job store."""
+    return max(_job_count, 0)
+
+
+def task_ids_with_reminders(task_ids) -> set:
+    """The subset of task_ids that already have a reminder job (one query on the Mongo job store)."""
+    if not _scheduler:
+        return set()
+    by_job_id = {_job_id(tid): tid for tid in task_ids}
+    if not by_job_id:
+        return set()
+    if isinstance(_jobstore, MongoDBJobStore):
+        cursor = _jobstore.collection.find({"_id": {"$in": list(by_job_id)}}, projection={"_id": 1})
+        return {by_job_id[doc["_id"]] for doc in cursor}
+    # In-memory store: lookups are dict hits, no round trips
+    return {tid for jid, tid in by_job_id.items() if _scheduler.get_job(jid) is not None}
+
+
 def start_scheduler(app):
-    global _scheduler
+    global _scheduler, _jobstore, _job_count
     try:
         mail.init_app(app)
     except Exception as e:
-        _log(f"[Scheduler] Mail init fail: {e}", "error")
+        logger.error("[Scheduler] Mail init fail: %s", e)
 
     if _scheduler and _scheduler.running:
-        _log("[Scheduler] Already running — skipping init")
+        logger.info("[Scheduler] Already running - skipping init")
         return
 
+    _jobstore = _make_jobstore(app)
     _scheduler = BackgroundScheduler(
-        jobstores={"default": MemoryJobStore()},
+        jobstores={"default": _jobstore},
         executors={"default": ThreadPoolExecutor(10)},
-        job_defaults={"coalesce": True, "max_instances": 2, "misfire_grace_time": 300},
+        # Jobs missed while the app was down run once (coalesced) if at most 10 minutes
+        # late; an older reminder would arrive too close to (or after) the deadline
+        job_defaults={"coalesce": True, "max_instances": 2, "misfire_grace_time": 600},
         timezone=app.config.get("APSCHEDULER_TIMEZONE", "Asia/Kolkata"),
     )
+    # Listen before start() so no job event is missed. Seed the count without
+    # holding _job_count_lock across get_jobs(): the scheduler thread fires job
+    # events while holding its job store lock, so nesting the two could deadlock.
+    _scheduler.add_listener(_track_job_count, EVENT_JOB_ADDED | EVENT_JOB_REMOVED)
     _scheduler.start()
-    _log("[Scheduler] ✅ Started")
+    restored = len(_scheduler.get_jobs())  # jobs restored from the persistent store
+    _job_count = restored
+    logger.info("[Scheduler] Started")
 
     atexit.register(lambda: _scheduler.shutdown(wait=False))
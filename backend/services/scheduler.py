@@ -10,6 +10,8 @@ Why this design?
 - Prevents duplicate schedulers and undefined calls to EmailService.
 """
 
+import logging
+import time
 from datetime import datetime, timedelta
 from flask import current_app
 
@@ -19,8 +21,17 @@ from models_mongo import Task, User
 from services.reminder_service import (
     schedule_task_reminder_from_model,  # schedules a reminder for a Task+User
     remove_task_reminder,               # removes a reminder job by task_id
+    task_ids_with_reminders,            # which task ids already have a reminder job
+    get_scheduler,                      # the single app-wide BackgroundScheduler
+    get_job_count,                      # job count maintained by a scheduler listener
 )
 
+__all__ = ["TaskScheduler", "task_scheduler", "get_scheduler"]
+
+logger = logging.getLogger(__name__)
+
+STATUS_CACHE_TTL = 5  # seconds; the health endpoint may be polled by dashboards
+
 class TaskScheduler:
     """
     Lightweight wrapper that:
@@ -33,7 +44,7 @@ class TaskScheduler:
 
     def __init__(self):
         # No local BackgroundScheduler here — rely on reminder_service’s scheduler
-        pass
+        self._status_cache = None  # (expires_at, status)
 
     # ------------------------------------------------------------------
     # 🔍 SCAN & (RE)SCHEDULE UPCOMING DEADLINES
@@ -42,32 +53,37 @@ class TaskScheduler:
         """
         Finds tasks due within the next 24 hours (not completed) and ensures
         a reminder is scheduled 30 minutes before their deadline.
-        Safe to run periodically (e.g., hourly via a cron or manual trigger).
+
+        Reminders are scheduled as dated jobs when tasks are created/updated,
+        so this is only a reconciliation pass: tasks that already have a job
+        are left alone. Safe to run periodically (e.g., hourly via a cron or
+        manual trigger).
         """
         try:
             now = datetime.utcnow()
             next_24h = now + timedelta(hours=24)
 
-            all_tasks = Task.find_all() if hasattr(Task, "find_all") else []
-            upcoming = [
-                t for t in all_tasks
-                if t.deadline
-                and isinstance(t.deadline, datetime)
-                and now < t.deadline <= next_24h
-                and t.status != "completed"
-            ]
+            # Range query on the (deadline, status) index instead of a full scan
+            upcoming = Task.find_due_between(now, next_24h)
+
+            logger.info("[Scheduler] Found %d tasks due within 24h.", len(upcoming))
 
-            print(f"[Scheduler] Found {len(upcoming)} tasks due within 24h.")
+            # One $in query on the job store instead of a lookup per task
+            scheduled = task_ids_with_reminders(t.id for t in upcoming)
+            missing = [t for t in upcoming if t.id not in scheduled]
+            local_now = datetime.now()  # one clock read for the whole pass
+            # One $in query for all owners instead of a lookup per task
+            users = User.find_by_ids(t.user_id for t in missing)
 
-            for task in upcoming:
-                user = User.find_by_id(task.user_id)
+            for task in missing:
+                user = users.get(task.user_id)
                 if not user:
                     continue
                 # (Re-)schedule using the shared scheduler in reminder_service
-                schedule_task_reminder_from_model(current_app, task, user)
+                schedule_task_reminder_from_model(current_app, task, user, now=local_now)
 
         except Exception as e:
-            print(f"[Scheduler] Error while scanning deadlines: {e}")
+            logger.error("[Scheduler] Error while scanning deadlines: %s", e)
 
     # ------------------------------------------------------------------
     # 🧹 REMOVE REMINDERS FOR A TASK
@@ -76,7 +92,7 @@ class TaskScheduler:
         """Remove the scheduled reminder for this task (if any)."""
         try:
             remove_task_reminder(task_id)
-            print(f"[Scheduler] Removed reminder for task {task_id}")
+            logger.debug("[Scheduler] Removed reminder for task %s", task_id)
         except Exception:
             # Job may not exist; ignore
             pass
@@ -86,33 +102,30 @@ class TaskScheduler:
     # ------------------------------------------------------------------
     def get_scheduler_status(self):
         """
-        Returns a lightweight status summary derived from tasks & deadlines.
+        Returns a lightweight status summary of the shared scheduler.
+        Cached for STATUS_CACHE_TTL seconds; never touches the database.
         We don’t expose the internal scheduler instance here.
         """
+        now = time.monotonic()
+        if self._status_cache and self._status_cache[0] > now:
+            return self._status_cache[1]
+
         try:
-            upcoming_count = 0
-            now = datetime.utcnow()
-            next_24h = now + timedelta(hours=24)
-            all_tasks = Task.find_all() if hasattr(Task, "find_all") else []
-            for t in all_tasks:
-                if (
-                    t.deadline and isinstance(t.deadline, datetime)
-                    and now < t.deadline <= next_24h
-                    and t.status != "completed"
-                ):
-                    upcoming_count += 1
-
-            return {
-                "running": True,                      # the real scheduler lives in reminder_service
-                "jobs_count_hint": upcoming_count,    # hint based on tasks due soon
+            scheduler = get_scheduler()
+            status = {
+                "running": bool(scheduler and scheduler.running),
+                "jobs_count": get_job_count(),
                 "note": "Jobs are managed by services.reminder_service",
             }
         except Exception as e:
-            return {
+            status = {
                 "running": False,
-                "jobs_count_hint": 0,
+                "jobs_count": 0,
                 "error": str(e),
             }
 
+        self._status_cache = (now + STATUS_CACHE_TTL, status)
+        return status
+
 # Global instance (as expected by your app)
 task_scheduler = TaskScheduler()
@@ -3,170 +3,460 @@ Translation Service for multilingual task parsing.
 Handles language detection, translation, and NLP processing.
 """
 
+import logging
+import os
 import re
-from typing import Dict, Optional, Tuple
+import sys
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from langdetect import detect, DetectorFactory
-from deep_translator import GoogleTranslator
-import nltk
+from cachetools import TTLCache
 
-# Make langdetect deterministic
-DetectorFactory.seed = 0
+try:
+    # Optional: one-pass multi-pattern matching for phrase keywords
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# langdetect and deep_translator are imported on first use so that
+# app startup (and processes that never translate) don't pay for them.
+
+
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
 
 
 def _clean_text(s: str) -> str:
     """Normalize spaces and strip control characters for stabler detection."""
-    s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return _WS_RE.sub(" ", (s or "").strip())
+
+
+# Languages where \w+ doesn't split text into whole words (no spaces, combining
+# vowel signs, attached prefixes/suffixes). These keep substring matching.
+_SUBSTRING_LANGS = frozenset({
+    'zh', 'ja', 'ko', 'ar', 'hi', 'te', 'ta', 'kn', 'ml', 'bn', 'gu', 'mr', 'pa'
+})
+
+
+@lru_cache(maxsize=1024)
+def normalize_text(s: str) -> str:
+    """Clean, NFKC-normalize and casefold text once for keyword matching (memoized)."""
+    return unicodedata.normalize('NFKC', _clean_text(s)).casefold()
+
+
+_detector_lock = threading.Lock()
+_detector_seeded = False
+
+
+def _detector():
+    """langdetect's detect_langs, imported lazily and made deterministic (seeded once)."""
+    global _detector_seeded
+    from langdetect import detect_langs, DetectorFactory
+    if not _detector_seeded:
+        with _detector_lock:
+            if not _detector_seeded:
+                DetectorFactory.seed = 0
+                _detector_seeded = True
+    return detect_langs
+
+
+@lru_cache(maxsize=None)
+def _cld3():
+    """pycld3 (native CLD3 model) if installed; langdetect is used otherwise."""
+    try:
+        import cld3
+        return cld3
+    except ImportError:
+        return None
+
+
+# Repeated task titles ("doctor appointment", recurring reminders) hit these
+# caches instead of re-running detection or a network round trip. They are
+# keyed on the cleaned text, per process (each worker has its own), and
+# failures raise so they are never cached. Call clear_caches() after changing
+# detector/translator configuration.
+@lru_cache(maxsize=4096)
+def _cached_detect(cleaned: str) -> Tuple[str, float]:
+    """(language_code, model probability)."""
+    cld3 = _cld3()
+    if cld3 is not None:
+        result = cld3.get_language(cleaned)
+        if result and result.is_reliable:
+            return result.language.split('-')[0], result.probability
+    best = _detector()(cleaned)[0]
+    return best.lang, best.prob
+
+
+# Translations are keyed on (source_lang, cleaned_text) and expire after a day
+_translation_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+_translation_lock = threading.Lock()
+
+
+def _translate_uncached(cleaned: str, source_lang: str) -> str:
+    if _cloud_api_key():
+        return _cloud_translate([cleaned], source_lang)[0][0]
+    # GoogleTranslator keeps per-call state on the instance and opens no pooled
+    # connection, so a fresh one per call is as cheap as reusing one and thread-safe
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator(source=source_lang, target='en').translate(cleaned)
+
+
+def _cached_translate(cleaned: str, source_lang: str) -> str:
+    key = (source_lang, cleaned)
+    with _translation_lock:
+        hit = _translation_cache.get(key)
+    if hit is None:
+        hit = _translate_uncached(cleaned, source_lang)
+        with _translation_lock:
+            _translation_cache[key] = hit
+    return hit
+
+
+def clear_caches() -> None:
+    """Drop memoized detections, translations, keyword matches and normalized text."""
+    _cached_detect.cache_clear()
+    _match_keywords.cache_clear()
+    with _translation_lock:
+        _translation_cache.clear()
+    normalize_text.cache_clear()
+
+
+# ---------------------------------------------------------
+# Google Cloud Translation (optional, enabled by GOOGLE_TRANSLATE_API_KEY)
+# ---------------------------------------------------------
+_CLOUD_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+_CLOUD_BATCH_LIMIT = 128  # max strings per translateText request
+_cloud_session = None
+
+
+def _cloud_api_key() -> str:
+    return (os.getenv("GOOGLE_TRANSLATE_API_KEY") or "").strip()
+
+
+def _get_cloud_session():
+    """One pooled keep-alive session, so batches reuse the TLS connection."""
+    global _cloud_session
+    if _cloud_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        _cloud_session = session
+    return _cloud_session
+
+
+def _cloud_translate(texts: List[str], source_lang: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    Translate texts to English, up to 128 per request.
+    Returns [(translated_text, source_language)] in input order; when
+    source_lang is omitted the API detects it per text.
+    """
+    results: List[Tuple[str, Optional[str]]] = []
+    for i in range(0, len(texts), _CLOUD_BATCH_LIMIT):
+        payload = {"q": texts[i:i + _CLOUD_BATCH_LIMIT], "target": "en", "format": "text"}
+        if source_lang:
+            payload["source"] = source_lang
+        resp = _get_cloud_session().post(
+            _CLOUD_TRANSLATE_URL, params={"key": _cloud_api_key()}, json=payload, timeout=10
+        )
+        resp.raise_for_status()
+        for item in resp.json()["data"]["translations"]:
+            results.append((item["translatedText"], item.get("detectedSourceLanguage") or source_lang))
+    return results
+
+
+# Keyword tables are read-only and shared by every instance, so they are built once at import.
+_LANGUAGE_NAMES: Mapping[str, str] = MappingProxyType({
+    'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German', 'it': 'Italian',
+    'pt': 'Portuguese', 'ru': 'Russian', 'ja': 'Japanese', 'ko': 'Korean', 'zh': 'Chinese',
+    'ar': 'Arabic', 'hi': 'Hindi', 'te': 'Telugu', 'ta': 'Tamil', 'kn': 'Kannada',
+    'ml': 'Malayalam', 'bn': 'Bengali', 'gu': 'Gujarati', 'mr': 'Marathi', 'pa': 'Punjabi'
+})
+
+# --- Priority keywords across languages ---
+_PRIORITY_KEYWORDS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    'urgent': {
+        'en': ('urgent', 'asap', 'immediately', 'critical', 'emergency'),
+        'es': ('urgente', 'inmediatamente', 'crítico', 'emergencia'),
+        'fr': ('urgent', 'immédiatement', 'critique', 'urgence'),
+        'de': ('dringend', 'sofort', 'kritisch', 'notfall'),
+        'hi': ('तुरंत', 'जरूरी', 'आपातकाल'),
+        'te': ('తక్షణం', 'అత్యవసరం'),
+        'ta': ('உடனடி', 'அவசரம்'),
+        'zh': ('紧急', '立即', '马上'),
+        'ja': ('緊急', 'すぐに', '至急'),
+        'ar': ('عاجل', 'فوري', 'طارئ')
+    },
+    'high': {
+        'en': ('high priority', 'important', 'high'),
+        'es': ('alta prioridad', 'importante', 'alto'),
+        'fr': ('haute priorité', 'important', 'élevé'),
+        'de': ('hohe priorität', 'wichtig', 'hoch'),
+        'hi': ('उच्च प्राथमिकता', 'महत्वपूर्ण'),
+        'te': ('అధిక ప్రాధాన్యత', 'ముఖ్యమైన'),
+        'ta': ('உயர் முன்னுரிமை', 'முக்கியமான'),
+        'zh': ('高优先级', '重要'),
+        'ja': ('高優先度', '重要'),
+        'ar': ('أولوية عالية', 'مهم')
+    },
+    'low': {
+        'en': ('low priority', 'when possible', 'eventually', 'low'),
+        'es': ('baja prioridad', 'cuando sea posible'),
+        'fr': ('basse priorité', 'quand possible', 'bas'),
+        'de': ('niedrige priorität', 'wenn möglich', 'niedrig'),
+        'hi': ('कम प्राथमिकता', 'जब संभव हो'),
+        'te': ('తక్కువ ప్రాధాన్యత',),
+        'ta': ('குறைந்த முன்னுரிமை',),
+        'zh': ('低优先级',),
+        'ja': ('低優先度',),
+        'ar': ('أولوية منخفضة', 'بطيء')
+    }
+})
+
+# --- Category keywords across languages ---
+_CATEGORY_KEYWORDS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    'work': {
+        'en': ('work', 'office', 'job', 'meeting', 'report', 'project', 'business'),
+        'es': ('trabajo', 'oficina', 'reunión', 'informe', 'proyecto', 'negocio'),
+        'fr': ('travail', 'bureau', 'réunion', 'rapport', 'projet', 'affaires'),
+        'de': ('arbeit', 'büro', 'besprechung', 'bericht', 'projekt', 'geschäft'),
+        'hi': ('काम', 'कार्यालय', 'नौकरी', 'बैठक', 'रिपोर्ट'),
+        'te': ('పని', 'కార్యాలయం', 'ఉద్యోగం', 'సమావేశం'),
+        'ta': ('வேலை', 'அலுவலகம்', 'கூட்டம்'),
+        'zh': ('工作', '办公室', '会议', '报告', '项目'),
+        'ja': ('仕事', 'オフィス', '会議', 'レポート'),
+        'ar': ('عمل', 'مكتب', 'اجتماع', 'تقرير')
+    },
+    'health': {
+        'en': ('doctor', 'appointment', 'medical', 'health', 'hospital', 'clinic'),
+        'es': ('doctor', 'cita', 'médico', 'salud', 'hospital'),
+        'fr': ('docteur', 'rendez-vous', 'médical', 'santé', 'hôpital'),
+        'de': ('arzt', 'termin', 'medizinisch', 'gesundheit', 'krankenhaus'),
+        'hi': ('डॉक्टर', 'अपॉइंटमेंट', 'स्वास्थ्य', 'अस्पताल'),
+        'te': ('డాక్టర్', 'అపాయింట్మెంట్', 'ఆరోగ్యం'),
+        'ta': ('மருத்துவர்', 'சுகாதாரம்'),
+        'zh': ('医生', '预约', '医疗', '健康', '医院'),
+        'ja': ('医者', '予約', '医療', '健康', '病院'),
+        'ar': ('طبيب', 'موعد', 'طبي', 'صحة', 'مستشفى')
+    },
+    'education': {
+        'en': ('study', 'homework', 'assignment', 'exam', 'school', 'university', 'college'),
+        'es': ('estudiar', 'tarea', 'examen', 'escuela', 'universidad'),
+        'fr': ('étudier', 'devoirs', 'examen', 'école', 'université'),
+        'de': ('studieren', 'hausaufgaben', 'prüfung', 'schule', 'universität'),
+        'hi': ('पढ़ाई', 'होमवर्क', 'परीक्षा', 'स्कूल', 'विश्वविद्यालय'),
+        'te': ('చదువు', 'హోంవర్క్', 'పరీక్ష', 'పాఠశాల'),
+        'ta': ('படிப்பு', 'பாடம்', 'தேர்வு', 'பள்ளி'),
+        'zh': ('学习', '作业', '考试', '学校', '大学'),
+        'ja': ('勉強', '宿題', '試験', '学校', '大学'),
+        'ar': ('دراسة', 'واجب', 'امتحان', 'مدرسة', 'جامعة')
+    },
+    'personal': {
+        'en': ('personal', 'home', 'family', 'friend', 'birthday', 'anniversary'),
+        'es': ('personal', 'casa', 'familia', 'amigo', 'cumpleaños'),
+        'fr': ('personnel', 'maison', 'famille', 'ami', 'anniversaire'),
+        'de': ('persönlich', 'zuhause', 'familie', 'freund', 'geburtstag'),
+        'hi': ('व्यक्तिगत', 'घर', 'परिवार', 'दोस्त'),
+        'te': ('వ్యక్తిగత', 'ఇల్లు', 'కుటుంబం', 'స్నేహితుడు'),
+        'ta': ('தனிப்பட்ட', 'வீடு', 'குடும்பம்', 'நண்பர்'),
+        'zh': ('个人', '家', '家庭', '朋友', '生日'),
+        'ja': ('個人', '家', '家族', '友達', '誕生日'),
+        'ar': ('شخصي', 'منزل', 'عائلة', 'صديق')
+    },
+    'shopping': {
+        'en': ('buy', 'purchase', 'shop', 'store', 'groceries', 'market'),
+        'es': ('comprar', 'tienda', 'mercado', 'comestibles'),
+        'fr': ('acheter', 'magasin', 'marché', 'épicerie'),
+        'de': ('kaufen', 'geschäft', 'markt', 'lebensmittel'),
+        'hi': ('खरीदना', 'दुकान', 'बाजार', 'किराना'),
+        'te': ('కొనుగోలు', 'దుకాణం', 'మార్కెట్'),
+        'ta': ('வாங்க', 'கடை', 'சந்தை'),
+        'zh': ('买', '购买', '商店', '市场', '杂货'),
+        'ja': ('買う', '購入', '店', '市場', '食料品'),
+        'ar': ('شراء', 'متجر', 'سوق', 'بقالة')
+    }
+})
+
+
+# Single words at least this long also match as the start of a longer word
+# (plurals, gerunds, compounds); shorter ones would misfire ("ami" in "amigo")
+_MIN_STEM_LEN = 4
+
+
+@lru_cache(maxsize=None)
+def _scan_plan() -> Dict[str, tuple]:
+    """
+    {lang: ((kind, label, terms, phrases, phrase_re), ...)} with all priority
+    levels first, then categories, each in table order.
+
+    For space-delimited languages, a single-word keyword of _MIN_STEM_LEN or
+    more characters is a phrase matched as a word prefix, so inflected and
+    compound forms still count ("meetings", "shopping", "arzttermin") while
+    word-internal hits do not ("work" in "homework", "high" in "thigh").
+    Shorter words and multi-word keywords are terms: words joined by single
+    spaces ("rendez-vous" -> "rendez vous") matched against the input's words
+    and word n-grams, so "job" does not fire inside "jobless". The trade-off is
+    that a prefix can still hit an unrelated word ("work" in "workout").
+    _SUBSTRING_LANGS keywords are all phrases matched anywhere. phrase_re is
+    one compiled alternation over the phrases (longest first), anchored at a
+    word start outside _SUBSTRING_LANGS. Keywords are interned so set lookups
+    hash them once.
+    """
+    plan: Dict[str, list] = {}
+    for kind, table in (('priority', _PRIORITY_KEYWORDS), ('category', _CATEGORY_KEYWORDS)):
+        for label, langs in table.items():
+            for lang, kws in langs.items():
+                # NFKC + casefold like the input text; duplicates collapse
+                norm = list(dict.fromkeys(sys.intern(normalize_text(k)) for k in kws))
+                if lang in _SUBSTRING_LANGS:
+                    terms, phrases, anchor = frozenset(), tuple(norm), ""
+                else:
+                    phrases = tuple(k for k in norm if len(k) >= _MIN_STEM_LEN and _WORD_RE.fullmatch(k))
+                    terms = frozenset(sys.intern(" ".join(_WORD_RE.findall(k))) for k in norm if k not in phrases)
+                    anchor = r"\b"
+                phrase_re = (
+                    re.compile(anchor + "(?:" + "|".join(map(re.escape, sorted(phrases, key=len, reverse=True))) + ")")
+                    if phrases else None
+                )
+                plan.setdefault(lang, []).append((kind, label, terms, phrases, phrase_re))
+    return {lang: tuple(entries) for lang, entries in plan.items()}
+
+
+@lru_cache(maxsize=None)
+def _max_term_words(source_lang: str) -> int:
+    """Longest keyword of the language in words, i.e. the largest n-gram worth building."""
+    return max((t.count(" ") + 1 for _, _, terms, _, _ in _scan_plan().get(source_lang, ()) for t in terms),
+               default=1)
+
+
+def _input_terms(normalized_text: str, source_lang: str) -> frozenset:
+    """The text's words plus its word n-grams up to the language's longest keyword."""
+    words = _WORD_RE.findall(normalized_text)
+    terms = set(words)
+    for n in range(2, _max_term_words(source_lang) + 1):
+        terms.update(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+    return frozenset(terms)
+
+
+@lru_cache(maxsize=None)
+def _phrase_automata() -> Dict[str, object]:
+    """
+    {lang: Aho-Corasick automaton over that language's phrase keywords}, so
+    all phrases are found in a single pass. Empty if pyahocorasick is missing.
+    Only _SUBSTRING_LANGS get one; word-prefix phrases need phrase_re's anchor.
+    """
+    if ahocorasick is None:
+        return {}
+    automata = {}
+    for lang, entries in _scan_plan().items():
+        if lang not in _SUBSTRING_LANGS:
+            continue
+        labels_by_phrase: Dict[str, list] = {}
+        for kind, label, _, phrases, _ in entries:
+            for p in phrases:
+                labels_by_phrase.setdefault(p, []).append((kind, label))
+        if not labels_by_phrase:
+            continue
+        automaton = ahocorasick.Automaton()
+        for p, labels in labels_by_phrase.items():
+            automaton.add_word(p, tuple(labels))
+        automaton.make_automaton()
+        automata[lang] = automaton
+    return automata
+
+
+def _phrase_hits(text: str, source_lang: str) -> Optional[set]:
+    """{(kind, label)} for every phrase keyword in text, or None without an automaton."""
+    automaton = _phrase_automata().get(source_lang)
+    if automaton is None:
+        return None
+    hits = set()
+    for _, labels in automaton.iter(text):
+        hits.update(labels)
+    return hits
+
+
+# Bulk imports and recurring tasks repeat the same titles, so the scan result is
+# memoized per (normalized_text, language); the tables it reads never change.
+@lru_cache(maxsize=4096)
+def _match_keywords(normalized_text: str, source_lang: str) -> Tuple[str, str]:
+    """(priority, category) for normalized text, defaulting to ('medium', 'general')."""
+    plan = _scan_plan().get(source_lang)
+    if not plan:
+        # No keywords for this language: skip tokenizing altogether
+        return 'medium', 'general'
+
+    # Tokenize once; keywords then match by set intersection with words/n-grams
+    tokens = frozenset() if source_lang in _SUBSTRING_LANGS else _input_terms(normalized_text, source_lang)
+    phrase_hits = _phrase_hits(normalized_text, source_lang)
+
+    # One pass over the plan; stop as soon as both kinds are decided
+    found: Dict[str, str] = {}
+    for kind, label, terms, _, phrase_re in plan:
+        if kind in found:
+            continue
+        if phrase_hits is not None:
+            hit = (kind, label) in phrase_hits
+        else:
+            hit = phrase_re is not None and phrase_re.search(normalized_text) is not None
+        if hit or not terms.isdisjoint(tokens):
+            found[kind] = label
+            if len(found) == 2:
+                break
+
+    return found.get('priority', 'medium'), found.get('category', 'general')
 
 
 class TranslationService:
     def __init__(self):
-        self._download_nltk_data()
-
-        self.language_names = {
-            'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German', 'it': 'Italian',
-            'pt': 'Portuguese', 'ru': 'Russian', 'ja': 'Japanese', 'ko': 'Korean', 'zh': 'Chinese',
-            'ar': 'Arabic', 'hi': 'Hindi', 'te': 'Telugu', 'ta': 'Tamil', 'kn': 'Kannada',
-            'ml': 'Malayalam', 'bn': 'Bengali', 'gu': 'Gujarati', 'mr': 'Marathi', 'pa': 'Punjabi'
-        }
-
-        # --- Priority keywords across languages ---
-        self.priority_keywords = {
-            'urgent': {
-                'en': ['urgent', 'asap', 'immediately', 'critical', 'emergency'],
-                'es': ['urgente', 'inmediatamente', 'crítico', 'emergencia'],
-                'fr': ['urgent', 'immédiatement', 'critique', 'urgence'],
-                'de': ['dringend', 'sofort', 'kritisch', 'notfall'],
-                'hi': ['तुरंत', 'जरूरी', 'आपातकाल'],
-                'te': ['తక్షణం', 'అత్యవసరం'],
-                'ta': ['உடனடி', 'அவசரம்'],
-                'zh': ['紧急', '立即', '马上'],
-                'ja': ['緊急', 'すぐに', '至急'],
-                'ar': ['عاجل', 'فوري', 'طارئ']
-            },
-            'high': {
-                'en': ['high priority', 'important', 'high'],
-                'es': ['alta prioridad', 'importante', 'alto'],
-                'fr': ['haute priorité', 'important', 'élevé'],
-                'de': ['hohe priorität', 'wichtig', 'hoch'],
-                'hi': ['उच्च प्राथमिकता', 'महत्वपूर्ण'],
-                'te': ['అధిక ప్రాధాన్యత', 'ముఖ్యమైన'],
-                'ta': ['உயர் முன்னுரிமை', 'முக்கியமான'],
-                'zh': ['高优先级', '重要'],
-                'ja': ['高優先度', '重要'],
-                'ar': ['أولوية عالية', 'مهم']
-            },
-            'low': {
-                'en': ['low priority', 'when possible', 'eventually', 'low'],
-                'es': ['baja prioridad', 'cuando sea posible', 'بطيء'],
-                'fr': ['basse priorité', 'quand possible', 'bas'],
-                'de': ['niedrige priorität', 'wenn möglich', 'niedrig'],
-                'hi': ['कम प्राथमिकता', 'जब संभव हो'],
-                'te': ['తక్కువ ప్రాధాన్యత'],
-                'ta': ['குறைந்த முன்னுரிமை'],
-                'zh': ['低优先级'],
-                'ja': ['低優先度'],
-                'ar': ['أولوية منخفضة']
-            }
-        }
-
-        # --- Category keywords across languages ---
-        self.category_keywords = {
-            'work': {
-                'en': ['work', 'office', 'job', 'meeting', 'report', 'project', 'business'],
-                'es': ['trabajo', 'oficina', 'reunión', 'informe', 'proyecto', 'negocio'],
-                'fr': ['travail', 'bureau', 'réunion', 'rapport', 'projet', 'affaires'],
-                'de': ['arbeit', 'büro', 'besprechung', 'bericht', 'projekt', 'geschäft'],
-                'hi': ['काम', 'कार्यालय', 'नौकरी', 'बैठक', 'रिपोर्ट'],
-                'te': ['పని', 'కార్యాలయం', 'ఉద్యోగం', 'సమావేశం'],
-                'ta': ['வேலை', 'அலுவலகம்', 'கூட்டம்'],
-                'zh': ['工作', '办公室', '会议', '报告', '项目'],
-                'ja': ['仕事', 'オフィス', '会議', 'レポート'],
-                'ar': ['عمل', 'مكتب', 'اجتماع', 'تقرير']
-            },
-            'health': {
-                'en': ['doctor', 'appointment', 'medical', 'health', 'hospital', 'clinic'],
-                'es': ['doctor', 'cita', 'médico', 'salud', 'hospital'],
-                'fr': ['docteur', 'rendez-vous', 'médical', 'santé', 'hôpital'],
-                'de': ['arzt', 'termin', 'medizinisch', 'gesundheit', 'krankenhaus'],
-                'hi': ['डॉक्टर', 'अपॉइंटमेंट', 'स्वास्थ्य', 'अस्पताल'],
-                'te': ['డాక్టర్', 'అపాయింట్మెంట్', 'ఆరోగ్యం'],
-                'ta': ['மருத்துவர்', 'சுகாதாரம்'],
-                'zh': ['医生', '预约', '医疗', '健康', '医院'],
-                'ja': ['医者', '予約', '医療', '健康', '病院'],
-                'ar': ['طبيب', 'موعد', 'طبي', 'صحة', 'مستشفى']
-            },
-            'education': {
-                'en': ['study', 'homework', 'assignment', 'exam', 'school', 'university', 'college'],
-                'es': ['estudiar', 'tarea', 'امتحان', 'escuela', 'universidad'],
-                'fr': ['étudier', 'devoirs', 'examen', 'école', 'université'],
-                'de': ['studieren', 'hausaufgaben', 'prüfung', 'schule', 'universität'],
-                'hi': ['पढ़ाई', 'होमवर्क', 'परीक्षा', 'स्कूल', 'विश्वविद्यालय'],
-                'te': ['చదువు', 'హోంవర్క్', 'పరీక్ష', 'పాఠశాల'],
-                'ta': ['படிப்பு', 'பாடம்', 'தேர்வு', 'பள்ளி'],
-                'zh': ['学习', '作业', '考试', '学校', '大学'],
-                'ja': ['勉強', '宿題', '試験', '学校', '大学'],
-                'ar': ['دراسة', 'واجب', 'امتحان', 'مدرسة', 'جامعة']
-            },
-            'personal': {
-                'en': ['personal', 'home', 'family', 'friend', 'birthday', 'anniversary'],
-                'es': ['personal', 'casa', 'familia', 'amigo', 'cumpleaños'],
-                'fr': ['personnel', 'maison', 'famille', 'ami', 'anniversaire'],
-                'de': ['persönlich', 'zuhause', 'familie', 'freund', 'geburtstag'],
-                'hi': ['व्यक्तिगत', 'घर', 'परिवार', 'दोस्त'],
-                'te': ['వ్యక్తిగత', 'ఇల్లు', 'కుటుంబం', 'స్నేహితుడు'],
-                'ta': ['தனிப்பட்ட', 'வீடு', 'குடும்பம்', 'நண்பர்'],
-                'zh': ['个人', '家', '家庭', '朋友', '生日'],
-                'ja': ['個人', '家', '家族', '友達', '誕生日'],
-                'ar': ['شخصي', 'منزل', 'عائلة', 'صديق']
-            },
-            'shopping': {
-                'en': ['buy', 'purchase', 'shop', 'store', 'groceries', 'market'],
-                'es': ['comprar', 'tienda', 'mercado', 'comestibles'],
-                'fr': ['acheter', 'magasin', 'marché', 'épicerie'],
-                'de': ['kaufen', 'geschäft', 'markt', 'lebensmittel'],
-                'hi': ['खरीदना', 'दुकान', 'बाजार', 'किराना'],
-                'te': ['కొనుగోలు', 'దుకాణం', 'మార్కెట్'],
-                'ta': ['வாங்க', 'கடை', 'சந்தை'],
-                'zh': ['买', '购买', '商店', '市场', '杂货'],
-                'ja': ['買う', '購入', '店', '市場', '食料品'],
-                'ar': ['شراء', 'متجر', 'سوق', 'بقالة']
-            }
-        }
+        self._warmup_detector()
+
+        self.language_names = _LANGUAGE_NAMES
+        self.priority_keywords = _PRIORITY_KEYWORDS
+        self.category_keywords = _CATEGORY_KEYWORDS
+
+        # Build the shared keyword plan now rather than on the first request
+        _scan_plan()
+        _phrase_automata()
 
     # ---------------------------------------------------------
     # Setup
     # ---------------------------------------------------------
-    def _download_nltk_data(self):
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
+    def _warmup_detector(self):
+        """Load langdetect's n-gram profiles now so the first real request doesn't pay for it."""
         try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
+            _detector()("warmup text")
+        except Exception:
+            pass
 
     # ---------------------------------------------------------
     # Language detection & translation
     # ---------------------------------------------------------
-    def detect_language(self, text: str) -> Tuple[str, float]:
+    def detect_language(self, text: str, is_clean: bool = False) -> Tuple[str, float]:
         """
         Detect the language of the input text.
-        Returns (language_code, confidence_heuristic)
+        Pass is_clean=True when the caller already ran _clean_text on it.
+        Returns (language_code, confidence)
         """
-        cleaned = _clean_text(text)
+        cleaned = text if is_clean else _clean_text(text)
         if not cleaned:
             return 'en', 0.0
+        # Fast path: plain ASCII text with letters is treated as English
+        if cleaned.isascii() and any(c.isalpha() for c in cleaned):
+            return 'en', 0.95
         try:
-            lang = detect(cleaned)
-            conf = 0.9 if len(cleaned) >= 10 else 0.7
-            print(f" Detected language: {lang} ({self.language_names.get(lang, 'Unknown')})")
+            lang, conf = _cached_detect(cleaned)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Detected language: %s (%s)", lang, self.language_names.get(lang, 'Unknown'))
             return lang, conf
         except Exception as e:
-            print(f" Language detection failed: {e}")
+            logger.warning("Language detection failed: %s", e)
             return 'en', 0.5
 
     def translate_to_english(self, text: str, source_lang: Optional[str] = None) -> Dict:
@@ -177,7 +467,8 @@ class TranslationService:
         cleaned = _clean_text(text)
         try:
             if not source_lang:
-                source_lang, _ = self.detect_language(cleaned)
+                # Plain ASCII is English (or digits/punctuation): no detector call
+                source_lang = 'en' if cleaned.isascii() else self.detect_language(cleaned, is_clean=True)[0]
 
             if source_lang == 'en':
                 return {
@@ -187,9 +478,10 @@ class TranslationService:
                     'translation_needed': False
                 }
 
-            print(f" Translating from {self.language_names.get(source_lang, source_lang)} to English...")
-            translated_text = GoogleTranslator(source=source_lang, target='en').translate(cleaned)
-            print(f" Translation: '{text}' → '{translated_text}'")
+            translated_text = _cached_translate(cleaned, source_lang)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Translated from %s: %r -> %r",
+                             self.language_names.get(source_lang, source_lang), text, translated_text)
 
             return {
                 'original_text': text,
@@ -200,7 +492,7 @@ class TranslationService:
 
         except Exception as e:
             # Graceful fallback: return original so downstream still works
-            print(f" Translation failed: {e}")
+            logger.warning("Translation failed: %s", e)
             return {
                 'original_text': text,
                 'translated_text': text,
@@ -209,34 +501,118 @@ class TranslationService:
                 'error': str(e)
             }
 
+    def translate_batch(self, texts: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Translate many texts (e.g. a bulk import) concurrently.
+        Detection/translation are network-bound, so threads overlap the latency.
+        Duplicate texts are only processed once. Results keep the input order.
+        """
+        unique = list(dict.fromkeys(texts))
+        if not unique:
+            return []
+
+        results = None
+        if _cloud_api_key():
+            try:
+                results = self._translate_unique_cloud(unique)
+            except Exception as e:
+                logger.warning("Batch translation failed, translating individually: %s", e)
+
+        if results is None:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as ex:
+                results = dict(zip(unique, ex.map(self.translate_to_english, unique)))
+        return [dict(results[t]) for t in texts]
+
+    def translate_many(self, texts: List[str], source_lang: str, max_workers: int = 8) -> List[str]:
+        """
+        Translate texts that share a known source language to English.
+        Cached entries are reused and duplicates collapse. With a Cloud
+        Translation key all misses go out as one batch request; otherwise (or
+        if that request fails) each miss is translated on its own, concurrently.
+        Texts that fail to translate are returned unchanged.
+        """
+        if source_lang == 'en' or not texts:
+            return list(texts)
+
+        cleaned = [_clean_text(t) for t in texts]
+        with _translation_lock:
+            found = {c: _translation_cache.get((source_lang, c)) for c in dict.fromkeys(cleaned)}
+
+        misses = [c for c, v in found.items() if v is None]
+        if misses and _cloud_api_key():
+            try:
+                translated = [t for t, _ in _cloud_translate(misses, source_lang)]
+                with _translation_lock:
+                    for c, t in zip(misses, translated):
+                        if t is not None:
+                            _translation_cache[(source_lang, c)] = t
+                found.update(zip(misses, translated))
+                misses = []
+            except Exception as e:
+                logger.warning("Batch translation failed, translating individually: %s", e)
+
+        if misses:
+            def translate_one(c: str) -> Optional[str]:
+                try:
+                    return _cached_translate(c, source_lang)
+                except Exception as e:
+                    logger.warning("Translation failed: %s", e)
+                    return None
+
+            # deep_translator sends one request per text, so overlap them
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as ex:
+                found.update(zip(misses, ex.map(translate_one, misses)))
+
+        return [found.get(c) or t for c, t in zip(cleaned, texts)]
+
+    def _translate_unique_cloud(self, unique: List[str]) -> Dict[str, Dict]:
+        """All non-English texts go to the Cloud Translation API in as few requests as possible."""
+        cleaned = {t: _clean_text(t) for t in unique}
+        langs = {t: self.detect_language(cleaned[t], is_clean=True)[0] for t in unique}
+        pending = [t for t in unique if langs[t] != 'en']
+        translated = dict(zip(pending, _cloud_translate([cleaned[t] for t in pending]))) if pending else {}
+
+        results = {}
+        for t in unique:
+            if t in translated:
+                text_en, src = translated[t]
+                results[t] = {
+                    'original_text': t,
+                    'translated_text': text_en,
+                    'source_language': src or langs[t],
+                    'translation_needed': True
+                }
+            else:
+                results[t] = {
+                    'original_text': t,
+                    'translated_text': t,
+                    'source_language': 'en',
+                    'translation_needed': False
+                }
+        return results
+
     # ---------------------------------------------------------
     # Keyword-based feature extraction
     # ---------------------------------------------------------
-    def extract_multilingual_features(self, original_text: str, source_lang: str) -> Dict:
+    def extract_multilingual_features(self, normalized_text: str, source_lang: str) -> Dict:
         """
-        Extract priority and category from original text using multilingual keywords.
+        Extract priority and category from the original text using multilingual keywords.
+        `normalized_text` must already be passed through normalize_text().
         Works even if translation fails.
         """
-        text_lower = _clean_text(original_text).lower()
-
-        # Priority
-        priority = 'medium'
-        for level, lang_kw in self.priority_keywords.items():
-            kws = lang_kw.get(source_lang, [])
-            if any(k in text_lower for k in kws):
-                priority = level
-                break
+        priority, category = _match_keywords(normalized_text, source_lang)
+        return {'priority': priority, 'category': category}
 
-        # Category
-        category = 'general'
-        for cat, lang_kw in self.category_keywords.items():
-            kws = lang_kw.get(source_lang, [])
-            if any(k in text_lower for k in kws):
-                category = cat
-                break
 
-        return {'priority': priority, 'category': category}
+# Lazily created singleton used by AIService
+translation_service: Optional[TranslationService] = None
+_singleton_lock = threading.Lock()
 
 
-# Global singleton used by AIService
-translation_service = TranslationService()
+def get_translation_service() -> TranslationService:
+    global translation_service
+    if translation_service is None:
+        with _singleton_lock:
+            if translation_service is None:
+                translation_service = TranslationService()
+    return translation_service
@@ -1,6 +1,10 @@
 # ✅ services/whatsapp_service.py (Improved)
 import os
-from typing import Optional, Dict, Any
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 try:
     from dotenv import load_dotenv, find_dotenv
@@ -9,8 +13,38 @@ except Exception:
     pass
 
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+
+@lru_cache(maxsize=8)
+def _get_client(account_sid: str, auth_token: str) -> Client:
+    """
+    One Twilio client per credential pair, shared by every WhatsAppService,
+    so sends reuse pooled keep-alive connections instead of new TLS handshakes.
+    """
+    http_client = TwilioHttpClient(pool_connections=True, timeout=10)
+    return Client(account_sid, auth_token, http_client=http_client)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for concurrent sends (size from TWILIO_POOL, default 16)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("TWILIO_POOL", "16")),
+                    thread_name_prefix="twilio-send",
+                )
+    return _executor
+
 
 class WhatsAppService:
     """
@@ -37,9 +71,10 @@ class WhatsAppService:
             print("[WhatsAppService] Invalid FROM — forcing sandbox sender")
             self.from_number = self.SANDBOX_FROM
 
-        self.client = Client(self.account_sid, self.auth_token)
+        self.client = _get_client(self.account_sid, self.auth_token)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_number(number: str) -> str:
         if not number:
             return ""
@@ -48,7 +83,7 @@ class WhatsAppService:
             return number
         if number.startswith("+"):
             return f"whatsapp:{number}"
-        digits = "".join(ch for ch in number if ch.isdigit())
+        digits = _NON_DIGIT_RE.sub("", number)
         return f"whatsapp:+{digits}" if digits else ""
 
     def _should_use_sandbox(self):
@@ -91,6 +126,14 @@ class WhatsAppService:
             print(f"[WhatsAppService ❌ Unexpected] {e}")
             return None
 
+    def send_many(self, messages: Iterable[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Send (to_number, body) pairs concurrently; each send is one HTTPS round
+        trip, so they overlap on a shared thread pool. Returns SIDs (None for
+        failures) in input order.
+        """
+        return list(_get_executor().map(lambda m: self.send_message(*m), messages))
+
     def user_opt_in_required(self, number: str) -> bool:
         """
         Check if this number must manually join sandbox.
@@ -6,35 +6,184 @@ Automates the installation and configuration process
 
 import os
 import sys
+import hashlib
 import subprocess
 import shutil
+import threading
+import venv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
 
-def run_command(command, cwd=None, check=True):
-    """Run a shell command and return the result"""
-    print(f"Running: {command}")
+BACKEND_DIR = Path("backend")
+FRONTEND_DIR = Path("frontend")
+
+# Platform-specific names, resolved once
+IS_WINDOWS = sys.platform == "win32"
+VENV_BIN = "Scripts" if IS_WINDOWS else "bin"
+EXE_SUFFIX = ".exe" if IS_WINDOWS else ""
+SCRIPT_EXT = ".bat" if IS_WINDOWS else ".sh"
+START_BACKEND = f"start_backend{SCRIPT_EXT}"
+START_FRONTEND = f"start_frontend{SCRIPT_EXT}"
+
+if IS_WINDOWS:
+    BACKEND_SCRIPT = """@echo off
+cd backend
+call venv\\Scripts\\activate
+python app.py
+"""
+    FRONTEND_SCRIPT = """@echo off
+cd frontend
+npm start
+"""
+else:
+    BACKEND_SCRIPT = """#!/bin/bash
+cd backend
+source venv/bin/activate
+python app.py
+"""
+    FRONTEND_SCRIPT = """#!/bin/bash
+cd frontend
+npm start
+"""
+
+# Fully pinned dependency set from the last resolve; lets reinstalls skip the resolver
+LOCK_FILE = "requirements.lock.txt"
+LOCK_HEADER = "# Generated by setup.py from requirements.txt blake2b: "
+
+_LAUNCH = "double-click " if IS_WINDOWS else "./"
+NEXT_STEPS_TEXT = f"""
+🎉 Setup complete! Next steps:
+
+1. Configure your OpenAI API key:
+   - Edit backend/.env
+   - Add your OpenAI API key: OPENAI_API_KEY=sk-your-key-here
+   - Get your key from: https://platform.openai.com/api-keys
+
+2. Start the application:
+   Backend:  {_LAUNCH}{START_BACKEND}
+   Frontend: {_LAUNCH}{START_FRONTEND}
+
+3. Access the application:
+   - Frontend: http://localhost:3000
+   - Backend API: http://localhost:5000
+
+4. Create your first account and start managing tasks!
+
+📚 For more information, see README.md
+"""
+
+# Written next to installed dependencies after a successful install
+INSTALL_STAMP = ".setup_state"
+
+def phase(func):
+    """Flush buffered status output once when a setup phase ends"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout.flush()
+    return wrapper
+
+def file_hash(path):
+    """Short BLAKE2b digest of a file's contents (change detection only), or None if it does not exist"""
+    path = Path(path)
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest() if path.exists() else None
+
+def is_installed(install_dir, manifest):
+    """True if install_dir was last installed from this exact manifest"""
+    stamp = Path(install_dir) / INSTALL_STAMP
+    return stamp.exists() and stamp.read_text().strip() == file_hash(manifest)
+
+def mark_installed(install_dir, manifest):
+    (Path(install_dir) / INSTALL_STAMP).write_text(file_hash(manifest) or "")
+
+def lock_is_current(lockfile, requirements):
+    """True if lockfile was frozen from this exact requirements.txt"""
+    lockfile = Path(lockfile)
+    if not lockfile.exists():
+        return False
+    with open(lockfile) as f:
+        return f.readline().strip() == f"{LOCK_HEADER}{file_hash(requirements)}"
+
+def write_lock(freeze_command, lockfile, requirements):
+    """Save `pip freeze` output, tagged with the requirements.txt it came from"""
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            cwd=cwd, 
-            check=check,
-            capture_output=True,
-            text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+        result = subprocess.run(freeze_command, capture_output=True, text=True)
+    except OSError as e:
+        result = None
+        print(f"⚠️  Could not write {LOCK_FILE}: {e}")
+    if result and result.returncode == 0:
+        Path(lockfile).write_text(f"{LOCK_HEADER}{file_hash(requirements)}\n{result.stdout}")
+
+# Serializes lines streamed from the parallel setup branches so they never mix mid-line
+_output_lock = threading.Lock()
+
+# Lines of a failed command's output repeated in its error report
+ERROR_TAIL_LINES = 200
+
+def run_command(command, cwd=None, check=True, prefix=""):
+    """
+    Run a command (argv list, no shell), streaming its output, and return the result.
+    Each line is written as it arrives, tagged with prefix (e.g. "[backend] ") so the
+    branches that install in parallel stay readable. On failure the command's last
+    lines are repeated after its exit status so the error is not lost in the other
+    branch's output.
+    """
+    with _output_lock:
+        print(f"{prefix}Running: {' '.join(map(str, command))}")
+        sys.stdout.flush()  # keep our buffered status lines ahead of the child's output
+    # Resolve the program through PATH/PATHEXT ourselves so e.g. npm.cmd works without a shell
+    argv = [shutil.which(command[0]) or command[0], *command[1:]]
+    # Only the last lines are kept, for the error report
+    tail = deque(maxlen=ERROR_TAIL_LINES)
+    try:
+        with subprocess.Popen(argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, errors="replace") as proc:
+            for line in proc.stdout:
+                if not line.endswith("\n"):
+                    line += "\n"  # a final unterminated line must not run into the next prefix
+                tail.append(line)
+                with _output_lock:
+                    sys.stdout.write(prefix + line)
+                    sys.stdout.flush()
+        result = subprocess.CompletedProcess(argv, proc.returncode)
+    except OSError as e:
+        print(f"{prefix}Error running command: {e}")
+        return None
+    if check and result.returncode != 0:
+        report = (f"{prefix}❌ {' '.join(map(str, command))} exited with status {result.returncode}; "
+                  f"last lines of its output:\n")
+        report += "".join(prefix + line for line in tail)
+        with _output_lock:
+            sys.stdout.write(report)
+            sys.stdout.flush()
+        return None
+    return result
+
+def get_version(executable):
+    """Return `executable --version` output, or None if it fails"""
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True)
+    except OSError:
         return None
+    return result.stdout.strip() if result.returncode == 0 else None
 
-def check_requirements():
-    """Check if required software is installed"""
+@phase
+def check_requirements(verbose=False):
+    """Check if required software is installed and the project layout is intact"""
     print("🔍 Checking requirements...")
     
+    # Every probe runs here, before any install starts, so a problem fails fast
+    if not BACKEND_DIR.exists():
+        print("❌ Backend directory not found")
+        return False
+    if not FRONTEND_DIR.exists():
+        print("❌ Frontend directory not found")
+        return False
+    
     # Check Python version
     python_version = sys.version_info
     if python_version < (3, 8):
@@ -42,48 +191,74 @@ def check_requirements():
         return False
     print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
     
-    # Check Node.js
-    node_result = run_command("node --version", check=False)
-    if not node_result or node_result.returncode != 0:
+    # Presence is a PATH lookup (PATHEXT-aware on Windows); no process is started
+    node_path = shutil.which("node")
+    npm_path = shutil.which("npm")
+    
+    if not node_path:
         print("❌ Node.js is required. Please install from https://nodejs.org/")
         return False
-    print(f"✅ Node.js {node_result.stdout.strip()}")
-    
-    # Check npm
-    npm_result = run_command("npm --version", check=False)
-    if not npm_result or npm_result.returncode != 0:
+    if not npm_path:
         print("❌ npm is required")
         return False
-    print(f"✅ npm {npm_result.stdout.strip()}")
+    
+    if verbose:
+        # Versions are only needed for display; probe both concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            node_version, npm_version = executor.map(get_version, [node_path, npm_path])
+        print(f"✅ Node.js {node_version or 'version unknown'} ({node_path})")
+        print(f"✅ npm {npm_version or 'version unknown'} ({npm_path})")
+    else:
+        print(f"✅ Node.js ({node_path})")
+        print(f"✅ npm ({npm_path})")
     
     return True
 
+@phase
 def setup_backend():
     """Setup the Flask backend"""
     print("\n🐍 Setting up backend...")
     
-    backend_dir = Path("backend")
-    if not backend_dir.exists():
-        print("❌ Backend directory not found")
-        return False
+    backend_dir = BACKEND_DIR
     
-    # Create virtual environment
-    print("Creating virtual environment...")
-    venv_command = "python -m venv venv"
-    if sys.platform == "win32":
-        activate_command = "venv\\Scripts\\activate"
-        pip_command = "venv\\Scripts\\pip"
-    else:
-        activate_command = "source venv/bin/activate"
-        pip_command = "venv/bin/pip"
-    
-    if not run_command(venv_command, cwd=backend_dir):
-        return False
+    venv_dir = backend_dir.resolve() / "venv"
+    pip_command = str(venv_dir / VENV_BIN / f"pip{EXE_SUFFIX}")
+    python_command = str(venv_dir / VENV_BIN / f"python{EXE_SUFFIX}")
     
-    # Install Python dependencies
-    print("Installing Python dependencies...")
-    if not run_command(f"{pip_command} install -r requirements.txt", cwd=backend_dir):
-        return False
+    requirements = backend_dir / "requirements.txt"
+    if Path(python_command).exists() and is_installed(venv_dir, requirements):
+        # Existing venv already installed from this exact requirements.txt
+        print("✅ Virtual environment and Python dependencies up to date")
+    else:
+        # Create virtual environment (reused if it is already there)
+        if not Path(python_command).exists():
+            print("Creating virtual environment...")
+            # Built in-process with this interpreter (no extra Python startup); symlinks avoid copying it on POSIX
+            try:
+                venv.EnvBuilder(with_pip=True, symlinks=not IS_WINDOWS).create(venv_dir)
+            except Exception as e:
+                print(f"❌ Failed to create virtual environment: {e}")
+                return False
+        
+        # Install Python dependencies; an up-to-date lock file is already fully
+        # resolved, so it installs with --no-deps and the resolver never runs
+        lockfile = backend_dir / LOCK_FILE
+        use_lock = lock_is_current(lockfile, requirements)
+        install_args = ["-r", LOCK_FILE, "--no-deps"] if use_lock else ["-r", "requirements.txt"]
+        print(f"Installing Python dependencies{' from ' + LOCK_FILE if use_lock else ''}...")
+        if shutil.which("uv"):
+            # uv resolves and downloads in parallel; much faster than pip when available
+            install_command = ["uv", "pip", "install", "--python", python_command, *install_args]
+            freeze_command = ["uv", "pip", "freeze", "--python", python_command]
+        else:
+            # Prefer wheels so nothing is built from source unless it has to be
+            install_command = [pip_command, "install", "--prefer-binary", *install_args]
+            freeze_command = [pip_command, "freeze"]
+        if not run_command(install_command, cwd=backend_dir, prefix="[backend] "):
+            return False
+        if not use_lock:
+            write_lock(freeze_command, lockfile, requirements)
+        mark_installed(venv_dir, requirements)
     
     # Create .env file if it doesn't exist
     env_file = backend_dir / ".env"
@@ -91,111 +266,94 @@ def setup_backend():
     
     if not env_file.exists() and env_example.exists():
         print("Creating .env file...")
-        shutil.copy(env_example, env_file)
+        shutil.copyfile(env_example, env_file)
         print("⚠️  Please edit backend/.env and add your OpenAI API key")
     
     print("✅ Backend setup complete")
     return True
 
+@phase
 def setup_frontend():
     """Setup the React frontend"""
     print("\n⚛️  Setting up frontend...")
     
-    frontend_dir = Path("frontend")
-    if not frontend_dir.exists():
-        print("❌ Frontend directory not found")
-        return False
+    frontend_dir = FRONTEND_DIR
     
-    # Install Node.js dependencies
-    print("Installing Node.js dependencies...")
-    if not run_command("npm install", cwd=frontend_dir):
-        return False
+    # Install Node.js dependencies (skipped if the lockfile is unchanged since the last install)
+    lockfile = frontend_dir / "package-lock.json"
+    modules_dir = frontend_dir / "node_modules"
+    if lockfile.exists() and is_installed(modules_dir, lockfile):
+        print("✅ Node.js dependencies up to date")
+    else:
+        print("Installing Node.js dependencies...")
+        # Cached tarballs first, and no audit/funding registry lookups. Dev dependencies
+        # stay: tailwindcss/postcss are needed by `npm start`
+        npm_flags = ["--prefer-offline", "--no-audit", "--no-fund"]
+        if lockfile.exists():
+            # Install straight from the lockfile, without resolving
+            npm_command = ["npm", "ci", *npm_flags]
+        else:
+            npm_command = ["npm", "install", *npm_flags]
+        if not run_command(npm_command, cwd=frontend_dir, prefix="[frontend] "):
+            return False
+        mark_installed(modules_dir, lockfile)
     
     print("✅ Frontend setup complete")
     return True
 
+def write_script(path, content):
+    """Write a start script; on POSIX it is made executable through the same descriptor"""
+    if IS_WINDOWS:
+        # No exec bit to set; a plain text-mode open() writes \r\n once
+        with open(path, "w") as f:
+            f.write(content)
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    # open()'s mode only applies to new files; an existing script keeps its old mode
+    os.fchmod(fd, 0o755)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+
+@phase
 def create_start_scripts():
     """Create convenient start scripts"""
     print("\n📝 Creating start scripts...")
     
-    # Backend start script
-    if sys.platform == "win32":
-        backend_script = """@echo off
-cd backend
-call venv\\Scripts\\activate
-python app.py
-"""
-        with open("start_backend.bat", "w") as f:
-            f.write(backend_script)
-        
-        frontend_script = """@echo off
-cd frontend
-npm start
-"""
-        with open("start_frontend.bat", "w") as f:
-            f.write(frontend_script)
-            
-        print("✅ Created start_backend.bat and start_frontend.bat")
-    else:
-        backend_script = """#!/bin/bash
-cd backend
-source venv/bin/activate
-python app.py
-"""
-        with open("start_backend.sh", "w") as f:
-            f.write(backend_script)
-        os.chmod("start_backend.sh", 0o755)
-        
-        frontend_script = """#!/bin/bash
-cd frontend
-npm start
-"""
-        with open("start_frontend.sh", "w") as f:
-            f.write(frontend_script)
-        os.chmod("start_frontend.sh", 0o755)
-        
-        print("✅ Created start_backend.sh and start_frontend.sh")
+    write_script(START_BACKEND, BACKEND_SCRIPT)
+    write_script(START_FRONTEND, FRONTEND_SCRIPT)
+    
+    print(f"✅ Created {START_BACKEND} and {START_FRONTEND}")
 
+@phase
 def print_next_steps():
     """Print instructions for next steps"""
-    print("\n🎉 Setup complete! Next steps:")
-    print("\n1. Configure your OpenAI API key:")
-    print("   - Edit backend/.env")
-    print("   - Add your OpenAI API key: OPENAI_API_KEY=sk-your-key-here")
-    print("   - Get your key from: https://platform.openai.com/api-keys")
-    
-    print("\n2. Start the application:")
-    if sys.platform == "win32":
-        print("   Backend:  double-click start_backend.bat")
-        print("   Frontend: double-click start_frontend.bat")
-    else:
-        print("   Backend:  ./start_backend.sh")
-        print("   Frontend: ./start_frontend.sh")
-    
-    print("\n3. Access the application:")
-    print("   - Frontend: http://localhost:3000")
-    print("   - Backend API: http://localhost:5000")
-    
-    print("\n4. Create your first account and start managing tasks!")
-    print("\n📚 For more information, see README.md")
+    sys.stdout.write(NEXT_STEPS_TEXT)
 
 def main():
     """Main setup function"""
+    # Status lines are flushed once per phase (see @phase) instead of on every newline
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("🚀 GenAI Task Manager Setup")
     print("=" * 40)
     
-    # Check requirements
-    if not check_requirements():
+    # Check requirements (--verbose also prints the node/npm versions)
+    if not check_requirements(verbose="--verbose" in sys.argv[1:]):
         print("\n❌ Setup failed: Missing requirements")
         sys.exit(1)
     
-    # Setup backend
-    if not setup_backend():
+    # Setup backend and frontend in parallel; pip and npm downloads overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend = executor.submit(setup_backend)
+        frontend = executor.submit(setup_frontend)
+        backend_ok, frontend_ok = backend.result(), frontend.result()
+    
+    if not backend_ok:
         print("\n❌ Setup failed: Backend setup error")
         sys.exit(1)
     
-    # Setup frontend
-    if not setup_frontend():
+    if not frontend_ok:
         print("\n❌ Setup failed: Frontend setup error")
         sys.exit(1)
     